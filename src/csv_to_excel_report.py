@@ -17,6 +17,8 @@ python src/csv_to_excel_report.py \
   --inputs data/sales_q1.csv data/sales_q2.csv data/sales_q3.csv data/sales_q4.csv \
   --out reports/sales_report.xlsx
 
+Optional: add --chunksize 200000 to stream large CSVs in chunks (bounded memory).
+
 
 Acceptance criteria:
 
@@ -34,15 +36,15 @@ No exceptions on missing optional columns (but fail if required headers missing)
 
 Implementation notes (pseudocode-level, exact ops to perform):
 
-Read CSVs with pd.read_csv, pd.concat (ignore_index=True)
+Read CSVs with pd.read_csv (parse_dates; non-numeric units/unit_price coerced to 0), pd.concat (ignore_index=True)
 
 Validate required cols: {"date","region","product","units","unit_price"}
 
-Cast units to Int64, unit_price to float, compute revenue = units*unit_price
+Cast units to int32 (int64 if out of range, float64 if fractional), unit_price to float64, compute revenue = units*unit_price
 
-Build pivot with groupby(["region","product"]).agg({"units":"sum","revenue":"sum"})
+Build pivot by summing units/revenue per (region, product) code with np.bincount
 
-Write with pd.ExcelWriter(engine="openpyxl")
+Write with an openpyxl write-only Workbook (rows streamed via ws.append)
 
 Use openpyxl to:
 
@@ -53,17 +55,73 @@ apply number formats: #,##0 for units; "$"#,##0.00 for revenue,
 insert BarChart on Summary (X = regions, Y = revenue_sum)
 """
 # csv_to_excel_report.py
+# pandas/numpy/openpyxl are imported inside the functions that use them so that
+# --help and argparse errors return without paying for those imports.
+from __future__ import annotations
+
 import argparse
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-import pandas as pd
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils import get_column_letter
-from openpyxl.chart import BarChart, Reference
+from typing import TYPE_CHECKING
 
-LIGHT_GRAY = PatternFill("solid", fgColor="DDDDDD")
-BOLD = Font(bold=True)
-THIN_BORDER = Border(top=Side(style="thin"))
-CENTER = Alignment(horizontal="center")
+if TYPE_CHECKING:
+    import pandas as pd
+    from openpyxl import Workbook
+
+@lru_cache(maxsize=None)
+def _style_parts():
+    """
+    Font/fill/border/alignment pieces of the report styles, built on first use.
+    These are immutable and can be shared; the NamedStyles built from them in
+    _styles() can't, since add_named_style binds a style to one workbook.
+    """
+    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+
+    thin = Side(style="thin")
+    return {
+        "LIGHT_GRAY": PatternFill("solid", fgColor="DDDDDD"),
+        "BOLD": Font(bold=True),
+        "THIN_BORDER": Border(top=thin),
+        "CENTER": Alignment(horizontal="center"),
+        # Same look as the header row DataFrame.to_excel used to write on Transactions
+        "TX_HEADER_BORDER": Border(left=thin, right=thin, top=thin, bottom=thin),
+        "TX_HEADER_ALIGN": Alignment(horizontal="center", vertical="top"),
+    }
+
+def _styles():
+    """
+    Named styles for the report, new objects on every call. They are registered
+    once per workbook (_add_named_styles); cells then share a single style record.
+    """
+    from openpyxl.styles import NamedStyle
+
+    parts = _style_parts()
+    BOLD, THIN_BORDER = parts["BOLD"], parts["THIN_BORDER"]
+    return (
+        NamedStyle(name="tx_header", font=BOLD, border=parts["TX_HEADER_BORDER"],
+                   alignment=parts["TX_HEADER_ALIGN"]),
+        NamedStyle(name="header", font=BOLD, fill=parts["LIGHT_GRAY"], alignment=parts["CENTER"]),
+        NamedStyle(name="currency", number_format="$#,##0.00"),
+        NamedStyle(name="int", number_format="#,##0"),
+        NamedStyle(name="date", number_format="yyyy-mm-dd"),
+        NamedStyle(name="total", font=BOLD, border=THIN_BORDER),
+        NamedStyle(name="total_int", font=BOLD, border=THIN_BORDER, number_format="#,##0"),
+        NamedStyle(name="total_currency", font=BOLD, border=THIN_BORDER, number_format="$#,##0.00"),
+    )
+
+REQUIRED = {"date", "region", "product", "units", "unit_price"}
+NUMERIC = ["units", "unit_price"]
+DATE_FORMAT = "%Y-%m-%d"  # explicit format keeps date parsing on the fast path (no per-row inference)
+
+def _positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}")
+    return value
 
 def arg_parse():
     p = argparse.ArgumentParser(
@@ -73,166 +131,255 @@ def arg_parse():
                    help="One or more input CSVs (e.g., --inputs data/q1.csv data/q2.csv)")
     p.add_argument("--out", required=True,
                    help="Output Excel file (e.g., reports/sales_report.xlsx)")
+    p.add_argument("--chunksize", type=_positive_int, default=None,
+                   help="Stream each CSV in chunks of this many rows instead of loading everything "
+                        "(e.g., --chunksize 200000)")
     return p.parse_args()
 
-def _autofit(ws, start_col=1, end_col=None, start_row=1, end_row=None, padding=2):
-    if end_col is None:
-        end_col = ws.max_column
-    if end_row is None:
-        end_row = ws.max_row
-    for col_idx in range(start_col, end_col + 1):
-        col_letter = get_column_letter(col_idx)
-        max_len = 0
-        for row in range(start_row, end_row + 1):
-            v = ws[f"{col_letter}{row}"].value
-            if v is None:
-                continue
-            max_len = max(max_len, len(str(v)))
-        ws.column_dimensions[col_letter].width = max(10, max_len + padding)
-
-def write_summary_sheet(writer: pd.ExcelWriter, df: pd.DataFrame):
-    """
-    Assumes df has: date, region, product, units, unit_price, revenue
-    Creates 'Summary' to match your checklist.
-    """
+def _text_widths(df, headers=None):
+    # Longest str() length per column, header included, computed column-wise in pandas
+    import numpy as np
+    import pandas as pd
 
-    # ---- Aggregations ----
-    pivot = (df.groupby(["region", "product"], as_index=False)
-               .agg(units_sum=("units", "sum"), revenue_sum=("revenue", "sum"))
-               .sort_values(["region", "product"], kind="stable"))
+    headers = pd.Index(df.columns if headers is None else headers).astype(str)
+    lengths = df.astype(str).apply(lambda s: s.str.len().max()).fillna(0).to_numpy(dtype=int)
+    return np.maximum(headers.str.len().to_numpy(), lengths)
+
+def _autofit(ws, widths, padding=2):
+    # widths: {column index: text length}; write-only sheets need this before the first append
+    from openpyxl.utils import get_column_letter
 
-    region_totals = (df.groupby("region", as_index=False)
-                       .agg(revenue_sum=("revenue", "sum"))
-                       .sort_values("revenue_sum", ascending=False, kind="stable"))
+    for col_idx in range(1, max(widths, default=0) + 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = max(10, widths.get(col_idx, 0) + padding)
 
-    product_totals = (df.groupby("product", as_index=False)
-                        .agg(revenue_sum=("revenue", "sum"))
-                        .sort_values("revenue_sum", ascending=False, kind="stable"))
+def _python_values(s):
+    # Series -> list of Python scalars in one C loop (Timestamps for datetimes).
+    # openpyxl would write NaN/NaT literally, so blank them out like DataFrame.to_excel
+    # does; the object copy this needs is only made for columns that contain NA.
+    if s.isna().any():
+        return s.astype(object).where(s.notna(), None).tolist()
+    return s.tolist()
+
+def _column_values(df, columns):
+    # Rows as tuples zipped from per-column lists: one boxing pass per column, no per-row Series
+    return zip(*(_python_values(df[c]) for c in columns))
+
+def _styled(ws, value, style):
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+def _header_row(ws, texts):
+    # One styled cell per header text ('header' named style); None leaves a gap column
+    return [None if text is None else _styled(ws, text, "header") for text in texts]
+
+def _add_named_styles(wb):
+    for style in _styles():
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+def start_transactions_sheet(wb: Workbook, columns):
+    """
+    Creates 'Transactions' on a write-only workbook and writes its header row.
+    Rows are then streamed in with append_transactions (date in column A).
+    """
+    from openpyxl.utils import get_column_letter
+
+    ws = wb.create_sheet("Transactions")
+    ws.column_dimensions[get_column_letter(1)].width = 14  # widen A (set before any row is written)
+    ws.append([_styled(ws, h, "tx_header") for h in columns])
+    return ws
+
+def append_transactions(ws, tx: pd.DataFrame, batch_rows=10_000):
+    from openpyxl.cell import WriteOnlyCell
+
+    # Convert batch_rows rows at a time, so only one batch exists as Python objects at once
+    for start in range(0, len(tx), batch_rows):
+        for date, *values in _column_values(tx.iloc[start:start + batch_rows], tx.columns):
+            # Only column A carries a style: the 'date' named style, attached as the cell is created
+            cell = WriteOnlyCell(ws, value=date)
+            cell.style = "date"
+            ws.append([cell, *values])
+
+def _key_totals(codes, uniques, revenue, key):
+    # revenue_sum per factorized key, skipping only the rows where this key is missing
+    import numpy as np
+    import pandas as pd
+
+    valid = codes >= 0
+    return pd.DataFrame({
+        key: np.asarray(uniques),
+        "revenue_sum": np.bincount(codes[valid], weights=revenue[valid], minlength=len(uniques)),
+    })
+
+def _region_product_pivot(df: pd.DataFrame):
+    """
+    Returns (pivot, region_totals, product_totals), each sorted by its key(s).
+    The pivot sums units/revenue per (region, product): both keys are factorized
+    (sorted) and folded into one integer code, so the sums are np.bincount
+    passes instead of a hash groupby. The per-region / per-product revenue
+    totals reuse the same codes, so a row missing only the other key still counts.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes_r, regions = pd.factorize(df["region"], sort=True)
+    codes_p, products = pd.factorize(df["product"], sort=True)
+    valid = (codes_r >= 0) & (codes_p >= 0)  # like groupby, drop rows with a missing key
+    n_products = len(products)
+    codes = codes_r[valid] * n_products + codes_p[valid]
+    size = len(regions) * n_products
+
+    counts = np.bincount(codes, minlength=size)
+    units_sum = np.bincount(codes, weights=df["units"].to_numpy()[valid], minlength=size)
+    revenue_sum = np.bincount(codes, weights=df["revenue"].to_numpy()[valid], minlength=size)
+
+    # Keep only combinations that occur; code order is already (region, product) order
+    present = np.flatnonzero(counts)
+    pivot = pd.DataFrame({
+        "region": np.asarray(regions)[present // n_products],
+        "product": np.asarray(products)[present % n_products],
+        "units_sum": units_sum[present],
+        "revenue_sum": revenue_sum[present],
+    })
+    revenue = df["revenue"].to_numpy()
+    return (pivot,
+            _key_totals(codes_r, regions, revenue, "region"),
+            _key_totals(codes_p, products, revenue, "product"))
+
+def _aggregate(df: pd.DataFrame):
+    """
+    Returns (pivot, region_totals, product_totals, monthly) for df: the
+    region x product pivot, revenue_sum per region and per product, and the
+    month (YYYY-MM) table with units_sum / revenue_sum columns.
+    """
+    import pandas as pd
+
+    pivot, region_totals, product_totals = _region_product_pivot(df)
 
     # Monthly trend (optional/bonus)
     if pd.api.types.is_datetime64_any_dtype(df["date"]):
-        month = df["date"].dt.strftime("%Y-%m")
+        # Truncate to month in NumPy instead of a per-row strftime; keep NaT rows out of the groups
+        month = pd.Series(df["date"].to_numpy().astype("datetime64[M]").astype(str),
+                          index=df.index).where(df["date"].notna())
     else:
         month = df["date"].astype(str).str[:7]
     monthly = (df.assign(month=month)
                  .groupby("month", as_index=False)
                  .agg(units_sum=("units", "sum"), revenue_sum=("revenue", "sum"))
                  .sort_values("month", kind="stable"))
+    return pivot, region_totals, product_totals, monthly
+
+def _combine(partials, keys):
+    # Merge per-chunk aggregates (small frames) into one table sorted by keys
+    import pandas as pd
+
+    if len(partials) == 1:
+        return partials[0]
+    return (pd.concat(partials, ignore_index=True, copy=False)
+              .groupby(keys, as_index=False, sort=True).sum())
+
+def write_summary_sheet(wb: Workbook, pivot: pd.DataFrame, region_totals: pd.DataFrame,
+                        product_totals: pd.DataFrame, monthly: pd.DataFrame, n_transactions: int,
+                        total_units: float, total_revenue: float):
+    """
+    Takes the aggregated tables from _aggregate (pivot: region, product, units_sum, revenue_sum;
+    region_totals / product_totals: key, revenue_sum; monthly: month, units_sum, revenue_sum)
+    and the transaction count / unit / revenue totals over all rows (including rows the
+    pivot drops for a missing region or product).
+    Creates 'Summary' to match your checklist.
+    """
+    from openpyxl.chart import BarChart, Reference
+
+    # ---- Aggregations ----
+    region_totals = region_totals.sort_values("revenue_sum", ascending=False, kind="stable")
+    product_totals = product_totals.sort_values("revenue_sum", ascending=False, kind="stable")
 
     # ---- KPI values ----
-    total_revenue = float(df["revenue"].sum())
-    total_units = int(df["units"].sum())
+    total_revenue = float(total_revenue)
+    total_units = int(total_units)
     aov = (total_revenue / total_units) if total_units else 0.0
-    n_transactions = int(len(df))
-    top_region = region_totals.iloc[0]["region"] if not region_totals.empty else ""
-    top_product = product_totals.iloc[0]["product"] if not product_totals.empty else ""
+    top_region = region_totals.iat[0, 0] if not region_totals.empty else ""
+    top_product = product_totals.iat[0, 0] if not product_totals.empty else ""
 
     # ---- Create & format sheet ----
-    pd.DataFrame().to_excel(writer, sheet_name="Summary", index=False)
-    ws = writer.book["Summary"]
+    ws = wb.create_sheet("Summary")
     ws.column_dimensions.width = 19
-    # 1) KPI block A1:D6 (we use A for labels, B for values; C:D left blank but reserved)
-    ws["A1"].value = "Label"; ws["B1"].value = "Value"
-    ws["A1"].font = BOLD; ws["B1"].font = BOLD
-    ws["A1"].fill = LIGHT_GRAY; ws["B1"].fill = LIGHT_GRAY
+    # Rows are built as lists of values / pre-styled cells and appended in one pass
+    rows = []
 
+    # 1) KPI block A1:B7 (we use A for labels, B for values)
+    rows.append(_header_row(ws, ["Label", "Value"]))
     kpi_rows = [
-        ("Total Revenue", total_revenue, "$#,##0.00"),
-        ("Total Units", total_units, "#,##0"),
-        ("Avg Order Value (AOV)", aov, "$#,##0.00"),
-        ("# Transactions", n_transactions, "#,##0"),
+        ("Total Revenue", total_revenue, "currency"),
+        ("Total Units", total_units, "int"),
+        ("Avg Order Value (AOV)", aov, "currency"),
+        ("# Transactions", n_transactions, "int"),
         ("Top Region (by Rev)", top_region, None),
         ("Top Product (by Rev)", top_product, None),
     ]
-    for i, (label, value, fmt) in enumerate(kpi_rows, start=2):
-        ws[f"A{i}"].value = label
-        ws[f"B{i}"].value = value
-        if fmt:
-            ws[f"B{i}"].number_format = fmt
-
-    # 2) Region × Product pivot at A8 with exact headers
-    start_row = 8
-    headers = ["region", "product", "units_sum", "revenue_sum"]
-    for j, h in enumerate(headers, start=1):
-        cell = ws.cell(row=start_row, column=j, value=h)
-        cell.font = BOLD; cell.fill = LIGHT_GRAY; cell.alignment = CENTER
-
-    r = start_row + 1
-    for _, row in pivot.iterrows():
-        ws.cell(row=r, column=1, value=row["region"])
-        ws.cell(row=r, column=2, value=row["product"])
-        cu = ws.cell(row=r, column=3, value=int(row["units_sum"]))
-        cr = ws.cell(row=r, column=4, value=float(row["revenue_sum"]))
-        cu.number_format = "#,##0"
-        cr.number_format = "$#,##0.00"
-        r += 1
-
-    last_pivot_row = r - 1
-    # Grand total row
-    ws.cell(row=r, column=1, value="Total").font = BOLD
-    ws.cell(row=r, column=2, value="")
-    units_col = get_column_letter(3)
-    rev_col = get_column_letter(4)
-    ws.cell(row=r, column=3,
-            value=f"=SUM({units_col}{start_row+1}:{units_col}{last_pivot_row})").number_format = "#,##0"
-    tot_rev_cell = ws.cell(row=r, column=4,
-            value=f"=SUM({rev_col}{start_row+1}:{rev_col}{last_pivot_row})")
-    tot_rev_cell.number_format = "$#,##0.00"
-    for c in range(1, 5):
-        ws.cell(row=r, column=c).font = BOLD
-        ws.cell(row=r, column=c).border = THIN_BORDER
-
-    after_pivot_row = r + 3  # spacing before monthly table
-
-    # 3) Region totals at G8 (G:H)
+    for label, value, style in kpi_rows:
+        rows.append([label, _styled(ws, value, style) if style else value])
+
+    # 2) Region × Product pivot at A8 with exact headers,
+    # 3) Region totals at G8 (G:H) and 4) Product totals at J8 (J:K) share its rows
+    start_row = len(rows) + 1
     rt_col = 7  # G
-    ws.cell(row=start_row, column=rt_col, value="region").font = BOLD
-    ws.cell(row=start_row, column=rt_col, value="region").fill = LIGHT_GRAY
-    ws.cell(row=start_row, column=rt_col+1, value="revenue_sum").font = BOLD
-    ws.cell(row=start_row, column=rt_col+1, value="revenue_sum").fill = LIGHT_GRAY
-
-    rr = start_row + 1
-    for _, row in region_totals.iterrows():
-        ws.cell(row=rr, column=rt_col, value=row["region"])
-        c = ws.cell(row=rr, column=rt_col+1, value=float(row["revenue_sum"]))
-        c.number_format = "$#,##0.00"
-        rr += 1
-
-    # 4) Product totals at J8 (J:K)
     pt_col = 10  # J
-    ws.cell(row=start_row, column=pt_col, value="product").font = BOLD
-    ws.cell(row=start_row, column=pt_col, value="product").fill = LIGHT_GRAY
-    ws.cell(row=start_row, column=pt_col+1, value="revenue_sum").font = BOLD
-    ws.cell(row=start_row, column=pt_col+1, value="revenue_sum").fill = LIGHT_GRAY
-
-    pr = start_row + 1
-    for _, row in product_totals.iterrows():
-        ws.cell(row=pr, column=pt_col, value=row["product"])
-        c = ws.cell(row=pr, column=pt_col+1, value=float(row["revenue_sum"]))
-        c.number_format = "$#,##0.00"
-        pr += 1
+    headers = ["region", "product", "units_sum", "revenue_sum"]
+    rows.append(_header_row(ws, [*headers, None, None,
+                                 "region", "revenue_sum", None,
+                                 "product", "revenue_sum"]))
+
+    # units_sum may be fractional (fractional units in the CSV); shown as whole units
+    pivot_values = [(region, product, int(units), rev)
+                    for region, product, units, rev in _column_values(pivot, headers)]
+    pivot_rows = [[region, product, _styled(ws, units, "int"), _styled(ws, rev, "currency")]
+                  for region, product, units, rev in pivot_values]
+    region_rows = [[region, _styled(ws, rev, "currency")]
+                   for region, rev in _column_values(region_totals, ["region", "revenue_sum"])]
+    product_rows = [[product, _styled(ws, rev, "currency")]
+                    for product, rev in _column_values(product_totals, ["product", "revenue_sum"])]
+    for p_row, r_row, pr_row in zip_longest(pivot_rows, region_rows, product_rows):
+        rows.append([*(p_row or [None] * 4), None, None,
+                     *(r_row or [None] * 2), None,
+                     *(pr_row or [None] * 2)])
+
+    # Grand total row: literal sums of the values written above (what =SUM() would give),
+    # not formulas, since openpyxl doesn't evaluate them and they'd stay empty until Excel recalculates
+    rows.append([
+        _styled(ws, "Total", "total"),
+        _styled(ws, "", "total"),
+        _styled(ws, sum(units for _, _, units, _ in pivot_values), "total_int"),
+        _styled(ws, float(pivot["revenue_sum"].sum()), "total_currency"),
+    ])
 
     # 5) Optional monthly trend starting after pivot + 3
+    rows.extend([[], []])  # spacing before monthly table
     m_headers = ["month (YYYY-MM)", "units_sum", "revenue_sum"]
-    mrow = after_pivot_row
-    for j, h in enumerate(m_headers, start=1):
-        cell = ws.cell(row=mrow, column=j, value=h)
-        cell.font = BOLD; cell.fill = LIGHT_GRAY; cell.alignment = CENTER
-    mrow += 1
-    for _, row in monthly.iterrows():
-        ws.cell(row=mrow, column=1, value=row["month"])
-        mu = ws.cell(row=mrow, column=2, value=int(row["units_sum"]))
-        mr = ws.cell(row=mrow, column=3, value=float(row["revenue_sum"]))
-        mu.number_format = "#,##0"
-        mr.number_format = "$#,##0.00"
-        mrow += 1
-
-    # 6) Styling & readability
-    _autofit(ws)
-  # rr currently points to the next empty row after writing region_totals
-    rt_header_row = start_row          # G8 header row
-    rt_first_data = start_row + 1      # G9 first data row
-    rt_last_data  = rr - 1             # last data row actually filled
+    rows.append(_header_row(ws, m_headers))
+    for month, units, rev in _column_values(monthly, ["month", "units_sum", "revenue_sum"]):
+        rows.append([month, _styled(ws, int(units), "int"), _styled(ws, rev, "currency")])
+
+    # 6) Styling & readability (widths must be set before the first append)
+    # KPI labels are constant; KPI values are short numbers or the top region/product name
+    widths = {1: max(len(label) for label, _, _ in kpi_rows),
+              2: max(14, len(str(top_region)), len(str(top_product)))}
+    for table, first_col, table_headers in ((pivot, 1, headers),
+                                            (region_totals, rt_col, None),
+                                            (product_totals, pt_col, None),
+                                            (monthly, 1, m_headers)):
+        for col_idx, w in enumerate(_text_widths(table, table_headers), start=first_col):
+            widths[col_idx] = max(widths.get(col_idx, 0), int(w))
+    _autofit(ws, widths)
+    for row in rows:
+        ws.append(row)
+
+    rt_header_row = start_row                      # G8 header row
+    rt_first_data = start_row + 1                  # G9 first data row
+    rt_last_data  = start_row + len(region_rows)   # last data row actually filled
     
     if rt_last_data >= rt_first_data:
         chart = BarChart()
@@ -250,48 +397,122 @@ def write_summary_sheet(writer: pd.ExcelWriter, df: pd.DataFrame):
         chart.width  = 20
         ws.add_chart(chart, "M8")  # place chart at M8 so it doesn’t overlap tables
 
+def _check_required(columns):
+    missing = REQUIRED - set(columns)
+    if missing:
+        raise ValueError(f"Missing required column(s): {sorted(missing)}")
+
+def _read_header(f):
+    import pandas as pd
+
+    return [c.strip().lower() for c in pd.read_csv(f, nrows=0).columns]
+
+def _read_csv(f, names, **kwargs):
+    import pandas as pd
+
+    # names is the normalized header, so dates can be parsed during the read itself.
+    # units/unit_price are left to the C parser's numeric inference: a forced dtype
+    # would abort the whole read on one bad cell (see the coercion in main()).
+    return pd.read_csv(f, header=0, names=names,
+                       parse_dates=["date"] if "date" in names else False,
+                       date_format=DATE_FORMAT,
+                       **kwargs)
+
+def _parse_dates(df: pd.DataFrame):
+    # Some value didn't match DATE_FORMAT and the column stayed text: fall back to
+    # pandas' format inference (as before the fast path), unparseable values -> NaT.
+    # Called per file (per chunk when streaming), since the format is inferred from
+    # the column's first value and files may use different formats.
+    import pandas as pd
+
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+def _read_inputs(inputs, chunksize=None):
+    """
+    Yields the input rows as DataFrames: one concatenated frame by default, or
+    chunks of at most chunksize rows per file so memory stays bounded.
+    Both modes accept the same inputs: required columns must appear in at least
+    one file, and a file missing some of them gets those columns as NA.
+    """
+    import pandas as pd
+
+    # Header-only reads, so a missing column fails before anything is streamed
+    headers = [_read_header(f) for f in inputs]
+    _check_required(set().union(*headers))
+
+    if chunksize is None:
+        yield pd.concat((_parse_dates(_read_csv(f, names)) for f, names in zip(inputs, headers)),
+                        ignore_index=True, copy=False)
+        return
+    for f, names in zip(inputs, headers):
+        # Same as what pd.concat does in the default mode for a file lacking a column
+        missing = dict.fromkeys(sorted(REQUIRED - set(names)))
+        with _read_csv(f, names, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield _parse_dates(chunk.assign(**missing) if missing else chunk)
+
+def _add_revenue(df: pd.DataFrame):
+    # Compute revenue on plain NumPy arrays (NA -> 0) instead of nullable Series arithmetic
+    import numpy as np
+
+    units = df["units"].to_numpy(dtype=np.float64, na_value=0.0)
+    unit_price = df["unit_price"].to_numpy(dtype=np.float64, na_value=0.0)
+    # Whole-number counts are stored as int32 (int64 if out of range); fractional
+    # units are kept as float64 so Transactions shows what the CSV had. Revenue stays float64.
+    if np.array_equal(units, np.trunc(units)):
+        int32 = np.iinfo(np.int32)
+        fits_int32 = units.size == 0 or (int32.min <= units.min() and units.max() <= int32.max)
+        df["units"] = units.astype(np.int32 if fits_int32 else np.int64)
+    else:
+        df["units"] = units
+    df["unit_price"] = unit_price
+    df["revenue"] = units * unit_price
+
 def main():
-    REQUIRED = {"date", "region", "product", "units", "unit_price"}
     args = arg_parse()
+    import pandas as pd
+    from openpyxl import Workbook
+
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Read & normalize
-    frames = []
-    for f in args.inputs:
-        df_part = pd.read_csv(f)
-        df_part.columns = [c.strip().lower() for c in df_part.columns]
-        # Try parse date
-        if "date" in df_part.columns:
-            df_part["date"] = pd.to_datetime(df_part["date"], errors="coerce")
-        frames.append(df_part)
-
-    df = pd.concat(frames, ignore_index=True)
-    missing = REQUIRED - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing required column(s): {sorted(missing)}")
-
-    # Compute revenue (ensure numeric)
-    df["units"] = pd.to_numeric(df["units"], errors="coerce").fillna(0)
-    df["unit_price"] = pd.to_numeric(df["unit_price"], errors="coerce").fillna(0.0)
-    df["revenue"] = df["units"] * df["unit_price"]
-
-    # Write Excel
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-        # Transactions sheet
-        tx = df.copy()
+    # Write Excel (write-only workbook: rows are streamed instead of kept as a cell DOM)
+    wb = Workbook(write_only=True)
+    _add_named_styles(wb)
+    ws_tx = None
+    pivots, region_parts, product_parts, monthlies = [], [], [], []
+    n_transactions = 0
+    total_units = total_revenue = 0.0
+    for df in _read_inputs(args.inputs, args.chunksize):
+        for col in NUMERIC:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                # A non-numeric cell kept the column as text: coerce those values to NA (-> 0 below)
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        # Low-cardinality keys as categoricals: int codes per row instead of Python strings
+        df[["region", "product"]] = df[["region", "product"]].astype("category")
+        _add_revenue(df)
         # nice column order if present
-        cols = [c for c in ["date","region","product","units","unit_price","revenue"] if c in tx.columns]
-        tx = tx[cols]
-        tx.to_excel(writer, sheet_name="Transactions", index=False)
-        # Apply date format + widen column A on Transactions
-        ws_tx = writer.book["Transactions"]
-        # If your date column is column A:
-        for r in range(2, ws_tx.max_row + 1):
-            ws_tx[f"A{r}"].number_format = "yyyy-mm-dd"  # or "dd-mmm-yyyy"
-        ws_tx.column_dimensions[get_column_letter(1)].width = 14  # widen A
-            # Summary sheet
-        write_summary_sheet(writer, df)
+        cols = [c for c in ["date","region","product","units","unit_price","revenue"] if c in df.columns]
+        if ws_tx is None:
+            ws_tx = start_transactions_sheet(wb, cols)
+        append_transactions(ws_tx, df[cols])
+        # Only the small per-chunk aggregates are kept
+        pivot, region_totals, product_totals, monthly = _aggregate(df)
+        pivots.append(pivot)
+        region_parts.append(region_totals)
+        product_parts.append(product_totals)
+        monthlies.append(monthly)
+        n_transactions += len(df)
+        total_units += df["units"].sum()
+        total_revenue += df["revenue"].sum()
+
+    write_summary_sheet(wb, _combine(pivots, ["region", "product"]),
+                        _combine(region_parts, ["region"]), _combine(product_parts, ["product"]),
+                        _combine(monthlies, ["month"]), n_transactions,
+                        total_units, total_revenue)
+    wb.save(out_path)
 
     print(f"Report written to {out_path}")
 
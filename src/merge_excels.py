@@ -23,14 +23,15 @@ Fails with clear error if headers mismatch
 
 Implementation notes:
 
-For each input: pd.read_excel(file, sheet_name=sheet)
+For each input (read concurrently): pd.read_excel(file, sheet_name=sheet)
 
-Confirm equal ordered headers across inputs
+Confirm equal ordered headers across inputs (header row only, before the full read)
 
 pd.concat → write to Excel (Merged)
 '''
+# pandas is imported inside the functions that use it so --help/argparse errors stay fast
 import argparse
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -43,30 +44,48 @@ def arg_parse():
     p.add_argument("--sheet", type=str, required=True, help="Select which sheet to merge")
     return p.parse_args()
 
+def normalize_headers(columns):
+    return tuple(c.strip().lower() for c in columns)
+
+def read_headers(f, sheet):
+    import pandas as pd
+
+    try:
+        header = pd.read_excel(f, sheet_name=sheet, nrows=0).columns
+    except ValueError:
+        sys.exit(f"Error: Sheet '{sheet}' not found in {f}")
+    return normalize_headers(header)
+
+def check_headers(file_headers):
+    # file_headers: (file, normalized headers) pairs; all must match the first one
+    expected_headers = None
+    for f, headers in file_headers:
+        if expected_headers is None:
+            expected_headers = headers
+        elif headers != expected_headers:
+            sys.exit(f"Error: Header mismatch in file {f}. "
+                     f"Expected {list(expected_headers)}, got {list(headers)}")
+
 def main():
     args = arg_parse()
+    import pandas as pd
+
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    all_part = []
-    expected_headers = None
-    for f in args.inputs:
-        try:
-            df_part = pd.read_excel(f, sheet_name=args.sheet)
-        except ValueError:
-            sys.exit(f"Error: Sheet '{args.sheet}' not found in {f}")
 
-        df_part.columns = [c.strip().lower() for c in df_part.columns]
+    # Header validation first (header row only), so a bad file fails before any full parse
+    check_headers((f, read_headers(f, args.sheet)) for f in args.inputs)
 
-        # Header validation
-        if expected_headers is None:
-            expected_headers = list(df_part.columns)
-        else:
-            if list(df_part.columns) != expected_headers:
-                sys.exit(f"Error: Header mismatch in file {f}. "
-                         f"Expected {expected_headers}, got {list(df_part.columns)}")
-
-        all_part.append(df_part)
-    df_merged = pd.concat(all_part, ignore_index=True)
+    # Inputs are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(args.inputs))) as ex:
+        all_part = list(ex.map(lambda f: pd.read_excel(f, sheet_name=args.sheet), args.inputs))
+    # The full read can be wider than the header row (e.g. a stray value past the last
+    # header becomes an "Unnamed: n" column), so check each frame's own columns again
+    for df_part in all_part:
+        df_part.columns = list(normalize_headers(df_part.columns))
+    check_headers((f, tuple(df_part.columns)) for f, df_part in zip(args.inputs, all_part))
+
+    df_merged = pd.concat(all_part, ignore_index=True, copy=False)
     df_merged.to_excel(out_path, index=False)
     print("Merging...")
 